@@ -3,26 +3,35 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import keyword
+import multiprocessing
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Generic, TypeAlias, Union
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, ClassVar, Generic, TextIO, TypeAlias, Union, cast
 
 import rdflib
 from pydantic import AnyUrl, BaseModel
 from pydantic_core import core_schema
 from pydantic_core.core_schema import AfterValidatorFunctionSchema
 from rdflib import RDF, XSD, BNode, Graph, Literal, Namespace, Node, URIRef
+from rdflib.plugins.stores.memory import SimpleMemory
 from typing_extensions import TypeVar
 
 __all__ = [
     "Addable",
     "AddableBase",
+    "CachedNamespace",
+    "Collector",
     "IsPredicateObject",
+    "Pending",
     "PredicateAnnotation",
     "PredicateObject",
     "RDFAnnotation",
     "RDFBaseModel",
     "RDFInstanceBaseModel",
     "RDFResource",
+    "Triples",
     "WithPredicate",
     "WithPredicateNamespace",
     "Year",
@@ -43,12 +52,175 @@ class Year(int):
         )
 
 
+# the same local unique identifiers tend to come up repeatedly (e.g., the same
+# ORCID on many papers), so reuse the URIs constructed for them. This is shared
+# by cached namespaces and :class:`WithPredicateNamespace` annotations
+@functools.lru_cache(maxsize=65_536)
+def _get_term(namespace: str, name: str) -> URIRef:
+    return URIRef(namespace + name)
+
+
+class CachedNamespace(Namespace):
+    """A namespace that reuses the URIs it constructs for the same names.
+
+    All cached namespaces share a single cache, which helps when the same
+    local unique identifiers come up repeatedly (e.g., the same ORCID on
+    many papers).
+    """
+
+    def term(self, name: str) -> URIRef:
+        """Get the URI for the name in this namespace."""
+        if isinstance(name, str):
+            return _get_term(self, name)
+        return super().term(name)
+
+
+def _get_term_getter(namespace: Namespace) -> Callable[[str], URIRef]:
+    """Get a function that gets URIs in the namespace, using the shared cache if possible.
+
+    Other kinds of namespaces, like :class:`rdflib.namespace.ClosedNamespace`,
+    can check or change their terms, so they're looked up as usual.
+    """
+    if type(namespace) in (Namespace, CachedNamespace):
+        return functools.partial(_get_term, namespace)
+    return cast(Callable[[str], URIRef], namespace.__getitem__)
+
+
 Primitive: TypeAlias = str | float | int | bool | datetime.date | datetime.datetime | Year
 
 AddableBase: TypeAlias = Union[Node, Primitive, "RDFInstanceBaseModel", AnyUrl]
 
 #: A type hint for things that can be handled
-Addable: TypeAlias = AddableBase | list["Addable"]
+Addable: TypeAlias = AddableBase | list["Addable"] | tuple["Addable", ...]
+
+#: A type hint for a buffer of triples that get added to a graph in one batch
+Triples: TypeAlias = list[tuple[Node, Node, Node]]
+
+
+class Pending(list[tuple["RDFBaseModel", Node]]):
+    """A stack of nested instances (and their nodes) whose triples still need to be collected.
+
+    The node for each instance is only looked up once, so an instance that's
+    referenced several times while serializing gets the same node each time,
+    even if :meth:`RDFBaseModel.get_node` makes a new one on each call.
+
+    Instances whose class overrides :meth:`RDFBaseModel.add_to_graph` are
+    added to a temporary graph when they're first looked up, and get the node
+    it returns, since it might not be the one from :meth:`RDFBaseModel.get_node`.
+    """
+
+    __slots__ = ("_graphs", "_nodes")
+
+    def __init__(self) -> None:
+        """Initialize an empty stack."""
+        super().__init__()
+        # these are keyed by id() since models aren't hashable. The model
+        # is kept alongside its node so its id() can't get reused
+        self._nodes: dict[int, tuple[RDFBaseModel, Node]] = {}
+        self._graphs: dict[int, Graph] = {}
+
+    def get_node(self, model: RDFBaseModel) -> Node:
+        """Get the node for the instance, which is only looked up the first time."""
+        entry = self._nodes.get(id(model))
+        if entry is None:
+            if type(model).add_to_graph is RDFBaseModel.add_to_graph:
+                node = model.get_node()
+            else:
+                graph = rdflib.Graph(store=SimpleMemory())
+                node = model.add_to_graph(graph)
+                self._graphs[id(model)] = graph
+            entry = self._nodes[id(model)] = (model, node)
+        return entry[1]
+
+    def set_node(self, model: RDFBaseModel, node: Node) -> None:
+        """Set the node for the instance, without looking it up."""
+        self._nodes[id(model)] = (model, node)
+
+    def pop_graph(self, model: RDFBaseModel) -> Graph | None:
+        """Get the temporary graph the instance was added to, if it was."""
+        return self._graphs.pop(id(model), None)
+
+    def push(self, model: RDFBaseModel) -> Node:
+        """Put the instance on the stack, and get its node."""
+        node = self.get_node(model)
+        self.append((model, node))
+        return node
+
+
+#: A type hint for a function that appends the triples for a value to the buffer
+Collector: TypeAlias = Callable[[Triples, Pending, Node, Addable], None]
+
+
+def _add_triples(graph: Graph, triples: Triples) -> None:
+    """Add all triples to the graph with a single call to :meth:`rdflib.Graph.addN`."""
+    graph.addN((s, p, o, graph) for s, p, o in triples)
+
+
+#: Characters that need to be escaped in N-Triples string literals
+_NT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+#: Characters that aren't allowed in URIs, which are the ones rdflib checks
+#: for, as well as control characters (N-Triples doesn't allow any of them)
+_INVALID_URI_CHARACTERS = frozenset('<>"{}|\\^`' + "".join(map(chr, range(0x21))))
+
+
+def _nt_uri(uri: str) -> str:
+    """Serialize a URI as an N-Triples term, making sure it can't break the syntax."""
+    if not _INVALID_URI_CHARACTERS.isdisjoint(uri):
+        raise ValueError(f"{uri!r} does not look like a valid URI, so it can't be serialized")
+    return f"<{uri}>"
+
+
+def _nt_term(node: Node) -> str:
+    """Serialize a node as an N-Triples term."""
+    if isinstance(node, Literal):
+        rv = f'"{node.translate(_NT_ESCAPES)}"'
+        if node.language:
+            return f"{rv}@{node.language}"
+        if node.datatype:
+            return f"{rv}^^{_nt_uri(node.datatype)}"
+        return rv
+    if isinstance(node, BNode):
+        return f"_:{node}"
+    return _nt_uri(cast(URIRef, node))
+
+
+def _nt_line(triple: tuple[Node, Node, Node]) -> str:
+    """Serialize a triple as an N-Triples line."""
+    s, p, o = triple
+    return f"{_nt_term(s)} {_nt_term(p)} {_nt_term(o)} .\n"
+
+
+def _dump_ntriples(model: RDFBaseModel) -> str:
+    """Serialize N-Triples for an instance, used in worker processes."""
+    return "".join(map(_nt_line, model.iter_triples()))
+
+
+def _walk(triples: Triples, pending: Pending, seen: set[Node]) -> Iterator[None]:
+    """Collect the triples for all pending instances, including ones nested inside them.
+
+    This walks nested instances with an explicit stack instead of recursion,
+    so deeply nested models don't run into Python's recursion limit. Instances
+    whose node is already in ``seen`` are skipped, so an instance that is
+    referenced several times (or in a cycle) only gets its triples collected once.
+    This yields after the triples for each instance are appended, so they
+    can be consumed before moving on to the next instance.
+    """
+    pop = pending.pop
+    while pending:
+        model, node = pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        model._rdf_collect(triples, pending, node)
+        yield
+
+
+def _collect_pending(triples: Triples, pending: Pending, seen: set[Node]) -> None:
+    """Collect the triples for all pending instances, including ones nested inside them."""
+    for _ in _walk(triples, pending, seen):
+        pass
 
 
 class RDFResource(URIRef):
@@ -75,27 +247,156 @@ class PredicateObject(BaseModel, Generic[T]):
     object: T
 
 
+#: The internal attributes of :class:`rdflib.Literal`, as of rdflib 7
+_LITERAL_SLOTS = ("_language", "_datatype", "_value", "_ill_typed")
+
+
+def _fast_str_literal(value: str) -> Literal:
+    """Construct a plain literal for a string without calling :meth:`rdflib.Literal.__new__`.
+
+    For a string without a language or datatype, the constructor's datatype
+    inference and normalization don't change anything, so the literal can be
+    made directly by setting its internal attributes.
+    """
+    literal = str.__new__(Literal, value)
+    literal._language = None
+    literal._datatype = None
+    literal._value = value
+    literal._ill_typed = None
+    return literal
+
+
+def _check_fast_str_literal() -> bool:
+    """Check that :func:`_fast_str_literal` gives the same result as the constructor."""
+    if Literal.__slots__ != _LITERAL_SLOTS:
+        return False
+    fast, reference = _fast_str_literal("test"), Literal("test")
+    return all(getattr(fast, slot) == getattr(reference, slot) for slot in _LITERAL_SLOTS)
+
+
+#: A function that makes a plain literal for a string, which falls back to
+#: the constructor if the internals of :class:`rdflib.Literal` have changed
+_make_str_literal: Callable[[str], Literal] = (
+    _fast_str_literal if _check_fast_str_literal() else Literal
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _str_to_literal(value: str) -> Literal:
+    return _make_str_literal(value)
+
+
+# this is typed since 1 == True, but they make different literals
+@functools.lru_cache(maxsize=4096, typed=True)
+def _primitive_to_literal(value: int | bool) -> Literal:
+    return Literal(value)
+
+
+# looking up terms in a DefinedNamespace is slow, so do it once
+_XSD_ANY_URI = XSD.anyURI
+_XSD_G_YEAR = XSD.gYear
+_RDF_TYPE = RDF.type
+_RDF_STATEMENT = RDF.Statement
+_RDF_SUBJECT = RDF.subject
+_RDF_PREDICATE = RDF.predicate
+_RDF_OBJECT = RDF.object
+
+
+def _url_to_literal(value: AnyUrl) -> Literal:
+    return Literal(value.unicode_string(), datatype=_XSD_ANY_URI)
+
+
+def _year_to_literal(value: Year) -> Literal:
+    return Literal(str(value), datatype=_XSD_G_YEAR)
+
+
+def _identity(value: Node) -> Node:
+    return value
+
+
+#: A lookup from exact types to functions that turn values into objects,
+#: which avoids checking against a chain of classes for the most common
+#: types. Subclasses fall back to checking with :func:`isinstance`.
+_OBJECT_HANDLERS: dict[type, Callable[[Any], Node]] = {
+    # floats and datetimes aren't cached since equal values can have
+    # different lexical forms, like 0.0 and -0.0
+    str: _str_to_literal,
+    int: _primitive_to_literal,
+    bool: _primitive_to_literal,
+    float: Literal,
+    datetime.date: Literal,
+    datetime.datetime: Literal,
+    Year: _year_to_literal,
+    AnyUrl: _url_to_literal,
+    URIRef: _identity,
+    BNode: _identity,
+    Literal: _identity,
+}
+
+
+#: Types of field values whose elements each get serialized with the same predicate
+_SEQUENCE_TYPES = (list, tuple)
+
+
+def _is_rdf_model(value: Any) -> bool:
+    """Check if the value is an RDF model without calling :func:`isinstance`."""
+    return getattr(type(value), "_is_rdf_model", False)
+
+
 class RDFAnnotation:
     """A harness that should be used as annotations inside a type hint."""
 
+    __slots__ = ()
+
 
 class PredicateAnnotation(RDFAnnotation, ABC):
     """For serializing values."""
 
-    @abstractmethod
+    __slots__ = ()
+
+    def collect(self, triples: Triples, pending: Pending, node: Node, value: Addable) -> None:
+        """Append the triples for the value to the buffer.
+
+        Nested instances aren't collected directly. Instead, the triple
+        pointing to their node is appended and they're put on the pending
+        stack. Subclasses that implement :meth:`add_to_graph` instead of
+        this get their triples collected through a temporary graph.
+        """
+        if type(self).add_to_graph is PredicateAnnotation.add_to_graph:
+            raise NotImplementedError
+        graph = rdflib.Graph(store=SimpleMemory())
+        self.add_to_graph(graph, node, value)
+        triples.extend(graph)
+
+    def bind(self) -> Collector:
+        """Get a function that appends the triples for a value to the buffer.
+
+        This gets called once per field when a model class is defined.
+        Subclasses can return a closure over their configuration so
+        serializing an instance avoids method and attribute lookups.
+        """
+        return self.collect
+
     def add_to_graph(self, graph: Graph, node: Node, value: Addable) -> None:
         """Add."""
-        raise NotImplementedError
-
-    def _handle_object(self, graph: Graph, value: AddableBase) -> Node:
-        if isinstance(value, RDFInstanceBaseModel):
-            return value.add_to_graph(graph)
+        triples: Triples = []
+        pending = Pending()
+        self.collect(triples, pending, node, value)
+        _collect_pending(triples, pending, set())
+        _add_triples(graph, triples)
+
+    def _handle_object(self, pending: Pending, value: AddableBase) -> Node:
+        handler = _OBJECT_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(value)
+        elif _is_rdf_model(value):
+            return pending.push(cast(RDFBaseModel, value))
         elif isinstance(value, Node):
             return value
         elif isinstance(value, AnyUrl):
-            return Literal(value.unicode_string(), datatype=XSD.anyURI)
+            return _url_to_literal(value)
         elif isinstance(value, Year):
-            return Literal(str(value), datatype=XSD.gYear)
+            return _year_to_literal(value)
         elif isinstance(value, Primitive):
             return Literal(value)
         else:
@@ -105,74 +406,370 @@ class PredicateAnnotation(RDFAnnotation, ABC):
 class IsPredicateObject(PredicateAnnotation):
     """A flag for objects that are predicate-object pairs."""
 
-    def add_to_graph(self, graph: Graph, node: Node, value: Addable) -> None:
-        """Add."""
-        if isinstance(value, list):
+    __slots__ = ()
+
+    def collect(self, triples: Triples, pending: Pending, node: Node, value: Addable) -> None:
+        """Append the triples for the value to the buffer."""
+        if isinstance(value, _SEQUENCE_TYPES):
             for subvalue in value:
-                self.add_to_graph(graph, node, subvalue)
+                self.collect(triples, pending, node, subvalue)
         elif isinstance(value, PredicateObject):
-            graph.add((node, value.predicate, self._handle_object(graph, value.object)))
+            triples.append((node, value.predicate, self._handle_object(pending, value.object)))
             # TODO support for other fields that would become
             #  axioms on this triple?
         else:
             raise TypeError
 
 
+def _bind(annotation: PredicateAnnotation) -> Collector:
+    """Get the collector for an annotation, which goes through its :meth:`add_to_graph` override."""
+    if type(annotation).add_to_graph is PredicateAnnotation.add_to_graph:
+        return annotation.bind()
+    # this skips any collect() override, which the add_to_graph() override can call via super()
+    return functools.partial(PredicateAnnotation.collect, annotation)
+
+
 class WithPredicate(PredicateAnnotation):
     """Serializes a field representing a value/entity using the given predicate."""
 
+    __slots__ = ("predicate",)
+
     def __init__(self, predicate: URIRef):
         """Initialize the configuration with a predicate."""
         self.predicate = predicate
 
-    def add_to_graph(self, graph: Graph, node: Node, value: Addable) -> None:
-        """Add to the graph."""
-        if isinstance(value, list):
-            for subvalue in value:
-                # we're recursively calling since all the elements in
-                # the list should get the same predicate treatment
-                self.add_to_graph(graph, node, subvalue)
-        else:
-            graph.add((node, self.predicate, self._handle_object(graph, value)))
+    def collect(self, triples: Triples, pending: Pending, node: Node, value: Addable) -> None:
+        """Append the triples for the value to the buffer."""
+        if not isinstance(value, _SEQUENCE_TYPES):
+            triples.append((node, self.predicate, self._handle_object(pending, value)))
+            return
+
+        # all the elements in the list get the same predicate treatment,
+        # so loop over them directly instead of recursively calling this
+        # function for each. Only nested lists (or tuples) need recursion.
+        predicate = self.predicate
+        append = triples.append
+        for subvalue in value:
+            handler = _OBJECT_HANDLERS.get(type(subvalue))
+            if handler is not None:
+                append((node, predicate, handler(subvalue)))
+            elif isinstance(subvalue, _SEQUENCE_TYPES):
+                self.collect(triples, pending, node, subvalue)
+            else:
+                append((node, predicate, self._handle_object(pending, subvalue)))
+
+    def bind(self) -> Collector:
+        """Get a function that appends the triples for a value to the buffer."""
+        predicate = self.predicate
+        handle_object = self._handle_object
+        collect = self.collect
+
+        def _collect(triples: Triples, pending: Pending, node: Node, value: Addable) -> None:
+            handler = _OBJECT_HANDLERS.get(type(value))
+            if handler is not None:
+                triples.append((node, predicate, handler(value)))
+            elif isinstance(value, _SEQUENCE_TYPES):
+                collect(triples, pending, node, value)
+            else:
+                triples.append((node, predicate, handle_object(pending, value)))
+
+        return _collect
 
 
 class WithPredicateNamespace(PredicateAnnotation):
     """Serializes a field representing an entity in a given namespace with the given predicate."""
 
-    def __init__(self, predicate: URIRef, namespace: Namespace) -> None:
-        """Initialize the annotation with the predicate and namespace."""
+    __slots__ = ("namespace", "predicate", "prefix")
+
+    def __init__(self, predicate: URIRef, namespace: Namespace, prefix: str | None = None) -> None:
+        """Initialize the annotation with the predicate and namespace.
+
+        If a prefix is given, it gets bound to the namespace in graphs created
+        with :meth:`RDFBaseModel.get_graph`, which makes serialized output more compact.
+        """
         self.namespace = namespace
         self.predicate = predicate
+        self.prefix = prefix
 
-    def add_to_graph(self, graph: Graph, node: Node, value: Addable) -> None:
-        """Add to the graph."""
+    def collect(self, triples: Triples, pending: Pending, node: Node, value: Addable) -> None:
+        """Append the triples for the value to the buffer."""
         if isinstance(value, str):
-            graph.add((node, self.predicate, self.namespace[value]))
-        elif isinstance(value, list):
+            triples.append((node, self.predicate, _get_term_getter(self.namespace)(value)))
+        elif isinstance(value, _SEQUENCE_TYPES):
+            predicate, get_term = self.predicate, _get_term_getter(self.namespace)
+            append = triples.append
             for subvalue in value:
-                self.add_to_graph(graph, node, subvalue)
+                if isinstance(subvalue, str):
+                    append((node, predicate, get_term(subvalue)))
+                else:
+                    self.collect(triples, pending, node, subvalue)
         else:
             raise TypeError(
                 f"constructing a URI for namespace {self.namespace} requires a string. Got: {value}"
             )
 
+    def bind(self) -> Collector:
+        """Get a function that appends the triples for a value to the buffer."""
+        predicate, get_term = self.predicate, _get_term_getter(self.namespace)
+        collect = self.collect
+
+        def _collect(triples: Triples, pending: Pending, node: Node, value: Addable) -> None:
+            if type(value) is str:
+                triples.append((node, predicate, get_term(value)))
+            else:
+                collect(triples, pending, node, value)
+
+        return _collect
+
 
 class RDFBaseModel(BaseModel, ABC):
     """A base class for Pydantic models that can be serialized to RDF."""
 
+    #: A marker for quickly identifying RDF models, since checking
+    #: :func:`isinstance` against an abstract base class is slow
+    _is_rdf_model: ClassVar[bool] = True
+
+    #: The names of fields that get serialized with a :class:`PredicateAnnotation`,
+    #: computed when the class is defined and again whenever it's rebuilt
+    _rdf_names: ClassVar[tuple[str, ...]] = ()
+    #: The annotations for the fields in :data:`_rdf_names`, in the same order
+    _rdf_annotations: ClassVar[tuple[PredicateAnnotation, ...]] = ()
+    #: The bound collectors (see :meth:`PredicateAnnotation.bind`) for the
+    #: fields in :data:`_rdf_names`, in the same order
+    _rdf_collectors: ClassVar[tuple[Collector, ...]] = ()
+    #: The prefixes and namespaces from :class:`WithPredicateNamespace` annotations
+    #: that should be bound in graphs created with :meth:`get_graph`
+    _rdf_namespaces: ClassVar[tuple[tuple[str, Namespace], ...]] = ()
+    #: The function that collects the triples for an instance when walking nested
+    #: instances. This is :meth:`_collect_local`, unless the class overrides
+    #: :meth:`add_to_graph`, in which case it goes through the override, or the
+    #: class is incomplete, in which case it's rebuilt first
+    _rdf_collect: ClassVar[Callable[[RDFBaseModel, Triples, Pending, Node], None]]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the predicate annotations of the fields after Pydantic builds the class."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._rdf_build()
+
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Any = None,
+    ) -> bool | None:
+        """Rebuild the model, then the cached predicate annotations of its fields.
+
+        Fields whose annotations are forward references that can't be resolved
+        when the class is defined don't have their metadata until the model is
+        rebuilt, which Pydantic also does automatically on first validation.
+        """
+        rv = super().model_rebuild(
+            force=force,
+            raise_errors=raise_errors,
+            _parent_namespace_depth=_parent_namespace_depth + 1,
+            _types_namespace=_types_namespace,
+        )
+        if rv:
+            cls._rdf_build()
+        return rv
+
+    @classmethod
+    def _rdf_build(cls) -> None:
+        """Cache the predicate annotations of the fields."""
+        names, annotations = [], []
+        for name, field in cls.model_fields.items():
+            field_annotations = [
+                annotation
+                for annotation in field.metadata
+                if isinstance(annotation, PredicateAnnotation)
+            ]
+            if not field_annotations:
+                continue
+            if len(field_annotations) > 1:
+                raise TypeError(
+                    f"{cls.__name__}.{name} has multiple predicate annotations: {field_annotations}"
+                )
+            names.append(name)
+            annotations.append(field_annotations[0])
+        cls._rdf_names = tuple(names)
+        cls._rdf_annotations = tuple(annotations)
+        cls._rdf_collectors = tuple(_bind(annotation) for annotation in annotations)
+        cls._rdf_namespaces = tuple(
+            {
+                (annotation.prefix, annotation.namespace): None
+                for annotation in annotations
+                if isinstance(annotation, WithPredicateNamespace) and annotation.prefix
+            }
+        )
+        cls._rdf_compile()
+        if cls.__pydantic_complete__:
+            cls._rdf_collect = cls._rdf_get_collect()
+        else:
+            cls._rdf_collect = RDFBaseModel._collect_after_rebuild
+
+    @classmethod
+    def _rdf_get_collect(cls) -> Callable[[RDFBaseModel, Triples, Pending, Node], None]:
+        """Get the function that collects the triples for an instance of the class."""
+        if cls.add_to_graph is RDFBaseModel.add_to_graph:
+            return cls._collect_local
+        return RDFBaseModel._collect_with_add_to_graph
+
+    @classmethod
+    def _rdf_compile(cls) -> None:
+        """Generate specialized functions for the class, after its fields are cached."""
+
     def model_dump_turtle(self) -> str:
         """Serialize turtle."""
         return self.get_graph().serialize(format="ttl")
 
+    def to_ntriples(self, file: TextIO) -> None:
+        """Write N-Triples to a text file, without constructing a graph."""
+        file.writelines(map(_nt_line, self.iter_triples()))
+
+    @classmethod
+    def to_ntriples_many(
+        cls,
+        instances: Iterable[RDFBaseModel],
+        file: TextIO,
+        *,
+        workers: int | None = None,
+        chunksize: int = 256,
+    ) -> None:
+        """Write N-Triples for several instances to a text file, using a pool of processes.
+
+        Each instance is serialized independently, so nested instances that
+        are shared between instances get their triples written more than once.
+        The instances must be picklable. If ``workers`` is 1, the instances
+        are serialized in the current process instead. Otherwise, ``workers``
+        is passed to :class:`multiprocessing.Pool`, so :data:`None` means
+        one process per CPU.
+        """
+        if workers == 1:
+            for instance in instances:
+                instance.to_ntriples(file)
+            return
+        with multiprocessing.Pool(workers) as pool:
+            file.writelines(pool.imap(_dump_ntriples, instances, chunksize=chunksize))
+
+    def iter_triples(self) -> Iterator[tuple[Node, Node, Node]]:
+        """Iterate over the triples for the instance (and nested instances).
+
+        This doesn't construct a graph, and only holds the triples for one
+        (nested) instance in memory at a time, so it can be used to stream
+        triples, e.g., to a file.
+        """
+        triples: Triples = []
+        pending = Pending()
+        pending.push(self)
+        for _ in _walk(triples, pending, set()):
+            yield from triples
+            triples.clear()
+
     def get_graph(self) -> rdflib.Graph:
-        """Get as RDF."""
-        graph = rdflib.Graph()
+        """Get as RDF.
+
+        The graph uses a context-unaware in-memory store, which is faster to
+        fill than rdflib's default store.
+        """
+        graph = rdflib.Graph(store=SimpleMemory())
+        for prefix, namespace in self._rdf_namespaces:
+            graph.bind(prefix, namespace)
         self.add_to_graph(graph)
         return graph
 
-    @abstractmethod
     def add_to_graph(self, graph: rdflib.Graph) -> Node:
-        """Add to the graph."""
+        """Add to the graph.
+
+        Subclasses can override this, e.g., to add extra triples. The override
+        is also used when an instance is nested inside another.
+        """
+        if not type(self).__pydantic_complete__:
+            type(self).model_rebuild(raise_errors=False)
+        triples: Triples = []
+        pending = Pending()
+        node = self.get_node()
+        pending.set_node(self, node)
+        # this calls _collect_local directly, since an override of this
+        # function that calls super() is already on the call stack
+        self._collect_local(triples, pending, node)
+        _collect_pending(triples, pending, {node})
+        _add_triples(graph, triples)
+        return node
+
+    @classmethod
+    def add_many_to_graph(
+        cls, instances: Iterable[RDFBaseModel], graph: rdflib.Graph
+    ) -> list[Node]:
+        """Add several instances to the graph in a single batch.
+
+        Nested instances that are shared between the instances only get
+        their triples added once.
+        """
+        triples: Triples = []
+        seen: set[Node] = set()
+        nodes = [instance.collect(triples, seen) for instance in instances]
+        _add_triples(graph, triples)
+        return nodes
+
+    @classmethod
+    def get_graph_many(cls, instances: Iterable[RDFBaseModel]) -> rdflib.Graph:
+        """Get a graph containing several instances."""
+        graph = rdflib.Graph(store=SimpleMemory())
+        for prefix, namespace in cls._rdf_namespaces:
+            graph.bind(prefix, namespace)
+        cls.add_many_to_graph(instances, graph)
+        return graph
+
+    def collect(self, triples: Triples, seen: set[Node] | None = None) -> Node:
+        """Append the triples for the instance (and nested instances) to the buffer.
+
+        Instances (including the one this is called on) whose nodes are in
+        ``seen`` are skipped, since it's assumed instances with the same node
+        represent the same entity. Nodes for collected instances are added to
+        ``seen``, so it can be reused across several calls to avoid redundant triples.
+
+        Nodes are looked up with :meth:`get_node` once per instance on each
+        call, so changes to an instance (or to the instances its node
+        depends on) are reflected the next time it's collected.
+        """
+        pending = Pending()
+        node = pending.push(self)
+        _collect_pending(triples, pending, set() if seen is None else seen)
+        return node
+
+    def _collect_local(self, triples: Triples, pending: Pending, node: Node) -> None:
+        """Append the triples for the instance, and put nested instances on the pending stack.
+
+        Subclasses that implement :meth:`add_to_graph` instead don't need this.
+        """
+        raise NotImplementedError
+
+    def _collect_after_rebuild(self, triples: Triples, pending: Pending, node: Node) -> None:
+        """Append the triples for an instance of an incomplete class, after rebuilding it.
+
+        A class whose annotations have unresolved forward references stays
+        incomplete when its instances are only created while validating
+        another class, so its fields can be missing their annotations.
+        """
+        cls = type(self)
+        cls.model_rebuild(raise_errors=False)
+        cls._rdf_get_collect()(self, triples, pending, node)
+
+    def _collect_with_add_to_graph(self, triples: Triples, pending: Pending, node: Node) -> None:
+        """Append the triples for an instance whose class overrides :meth:`add_to_graph`.
+
+        The instance has usually already been added to a temporary graph
+        when its node was looked up (see :class:`Pending`).
+        """
+        graph = pending.pop_graph(self)
+        if graph is None:
+            graph = rdflib.Graph(store=SimpleMemory())
+            self.add_to_graph(graph)
+        triples.extend(graph)
 
     @abstractmethod
     def get_node(self) -> Node:
@@ -180,12 +777,63 @@ class RDFBaseModel(BaseModel, ABC):
         raise NotImplementedError
 
 
-def _add_annotated(t: BaseModel, graph: rdflib.Graph, node: Node) -> None:
-    for name, field in t.__class__.model_fields.items():
-        for annotation in field.metadata:
-            if isinstance(annotation, PredicateAnnotation):
-                if value := getattr(t, name):
-                    annotation.add_to_graph(graph, node, value)
+def _get_field_lines(names: tuple[str, ...]) -> list[str]:
+    lines = []
+    for i, name in enumerate(names):
+        if name.isidentifier() and not keyword.iskeyword(name):
+            lines.append(f"    if value := self.{name}:")
+        else:
+            # fields made with create_model() can have names that can't be attributes in code
+            lines.append(f"    if value := getattr(self, {name!r}):")
+        lines.append(f"        _collect_{i}(triples, pending, node, value)")
+    return lines
+
+
+def _exec_function(
+    lines: list[str], collectors: tuple[Collector, ...], **constants: Any
+) -> Callable[..., None]:
+    namespace: dict[str, Any] = {
+        "_RDF_TYPE": _RDF_TYPE,
+        **constants,
+        **{f"_collect_{i}": collect for i, collect in enumerate(collectors)},
+    }
+    # the code only contains field names, either as identifiers or as string literals
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return cast(Callable[..., None], namespace["_generated"])
+
+
+def _compile_collect(
+    names: tuple[str, ...],
+    collectors: tuple[Collector, ...],
+    *,
+    typed: bool = False,
+    rdf_type: URIRef | None = None,
+) -> Callable[[RDFBaseModel, Triples, Pending, Node], None]:
+    """Generate a function that calls the collector for each annotated field.
+
+    Since all instances of a class have the same fields, this unrolls the
+    loop over the fields into one statement per field, which avoids
+    iterating, unpacking, and :func:`getattr` on each serialization.
+    For example, a class with ``name`` and ``wikidata`` fields gets:
+
+    .. code-block:: python
+
+        def _generated(self, triples, pending, node):
+            if value := self.name:
+                _collect_0(triples, pending, node, value)
+            if value := self.wikidata:
+                _collect_1(triples, pending, node, value)
+
+    For typed instance models, this also appends the ``rdf:type`` triple.
+    If the class already has its ``rdf_type``, it's bound as a constant in
+    the generated function, so the triple doesn't need an attribute lookup.
+    """
+    lines = ["def _generated(self, triples, pending, node):", "    pass"]
+    if typed:
+        obj = "self.rdf_type" if rdf_type is None else "_rdf_type"
+        lines.append(f"    triples.append((node, _RDF_TYPE, {obj}))")
+    lines.extend(_get_field_lines(names))
+    return _exec_function(lines, collectors, _rdf_type=rdf_type)
 
 
 class RDFUntypedInstanceBaseModel(RDFBaseModel, ABC):
@@ -196,11 +844,18 @@ class RDFUntypedInstanceBaseModel(RDFBaseModel, ABC):
     - All fields are opt-in for serialization to RDF and fully explicit.
     """
 
-    def add_to_graph(self, graph: rdflib.Graph) -> Node:
-        """Add to the graph."""
-        node = self.get_node()
-        _add_annotated(self, graph, node)
-        return node
+    #: Whether instances get an ``rdf:type`` triple
+    _rdf_typed: ClassVar[bool] = False
+
+    @classmethod
+    def _rdf_compile(cls) -> None:
+        """Generate a specialized function for collecting the triples of instances."""
+        cls._collect_local = _compile_collect(  # type:ignore[method-assign,assignment]
+            cls._rdf_names,
+            cls._rdf_collectors,
+            typed=cls._rdf_typed,
+            rdf_type=getattr(cls, "rdf_type", None),
+        )
 
 
 class RDFInstanceBaseModel(RDFUntypedInstanceBaseModel, ABC):
@@ -212,63 +867,81 @@ class RDFInstanceBaseModel(RDFUntypedInstanceBaseModel, ABC):
     """
 
     #: A variable denoting the RDF type that all instances of this
-    #: class will get serialized with
+    #: class will get serialized with. This is read once when the
+    #: class is defined, so it shouldn't be reassigned afterwards.
     rdf_type: ClassVar[URIRef]
 
-    def add_to_graph(self, graph: rdflib.Graph) -> Node:
-        """Add to the graph."""
-        node = super().add_to_graph(graph)
-        graph.add((node, RDF.type, self.rdf_type))
-        return node
+    _rdf_typed: ClassVar[bool] = True
 
 
 class TripleAnnotation(RDFAnnotation):
     """A base class for triple annotations."""
 
+    __slots__ = ()
+
 
 class IsSubject(TripleAnnotation):
     """An annotation for a field that denotes the subject."""
 
+    __slots__ = ()
+
 
 class IsPredicate(TripleAnnotation):
     """An annotation that denotes the predicate."""
 
+    __slots__ = ()
+
 
 class IsObject(TripleAnnotation):
     """An annotation for a field that denotes the object."""
 
+    __slots__ = ()
+
 
 class RDFTripleBaseModel(RDFBaseModel):
     """A base class for Pydantic models that represent triples and their annotations."""
 
-    def add_to_graph(self, graph: rdflib.Graph) -> Node:
-        """Add to the graph."""
-        subject = self._get(IsSubject, graph)
-        predicate = self._get(IsPredicate, graph)
-        obj = self._get(IsObject, graph)
-        graph.add((subject, predicate, obj))
+    #: A function generated for the class by :func:`_compile_collect`
+    #: that calls the collectors for all annotated fields
+    _rdf_add_annotated: ClassVar[Callable[[RDFBaseModel, Triples, Pending, Node], None]]
 
-        node = self.get_node()
-        graph.add((node, RDF.type, RDF.Statement))
-        graph.add((node, RDF.subject, subject))
-        graph.add((node, RDF.predicate, predicate))
-        graph.add((node, RDF.object, obj))
-        _add_annotated(self, graph, node)
-        return node
+    @classmethod
+    def _rdf_compile(cls) -> None:
+        """Generate a specialized function for collecting the triples of annotations."""
+        cls._rdf_add_annotated = _compile_collect(cls._rdf_names, cls._rdf_collectors)
+
+    def _collect_local(self, triples: Triples, pending: Pending, node: Node) -> None:
+        """Append the triple, its reification, and its annotations to the buffer."""
+        subject = self._get(IsSubject, pending)
+        predicate = self._get(IsPredicate, pending)
+        obj = self._get(IsObject, pending)
+        append = triples.append
+        append((subject, predicate, obj))
+
+        append((node, _RDF_TYPE, _RDF_STATEMENT))
+        append((node, _RDF_SUBJECT, subject))
+        append((node, _RDF_PREDICATE, predicate))
+        append((node, _RDF_OBJECT, obj))
+        self._rdf_add_annotated(triples, pending, node)
 
     def get_node(self) -> Node:
-        """Return a blank node, representing the reified triple."""
+        """Return a blank node, representing the reified triple.
+
+        Since this makes a new blank node on each call, the triple gets a
+        different node each time it's serialized. Within one serialization,
+        it keeps the same node (see :class:`Pending`).
+        """
         return BNode()
 
-    def _get(self, checker: type[TripleAnnotation], graph: rdflib.Graph) -> Node:
+    def _get(self, checker: type[TripleAnnotation], pending: Pending) -> Node:
         for name, field in self.__class__.model_fields.items():
             for annotation in field.metadata:
                 if isinstance(annotation, checker):
                     value = getattr(self, name)
                     # this has its own stripped-down implementation because
                     # it doesn't allow literals
-                    if isinstance(value, RDFBaseModel):
-                        return value.add_to_graph(graph)
+                    if _is_rdf_model(value):
+                        return pending.push(cast(RDFBaseModel, value))
                     elif isinstance(value, Node):
                         # TODO this can be further refined since subject can't accept literals,
                         #  so have validation be in the checker class itself
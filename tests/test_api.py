@@ -1,20 +1,27 @@
 """Tests for the metamodel."""
 
 import datetime
+import io
+import sys
 import unittest
 from collections.abc import Collection
-from typing import Annotated, ClassVar
+from typing import Annotated, Any, ClassVar
 
 import rdflib
-from pydantic import AnyUrl, BaseModel, Field
+from pydantic import AnyUrl, BaseModel, Field, create_model
 from pydantic_extra_types.language_code import ISO639_3
 from rdflib import DCTERMS, FOAF, RDF, RDFS, SDO, SKOS, XSD, BNode, Literal, Namespace, Node, URIRef
+from rdflib.namespace import ClosedNamespace
 
 from pydantic_metamodel.api import (
+    Addable,
+    CachedNamespace,
     IsObject,
     IsPredicate,
     IsPredicateObject,
     IsSubject,
+    Pending,
+    PredicateAnnotation,
     PredicateObject,
     RDFBaseModel,
     RDFInstanceBaseModel,
@@ -25,14 +32,16 @@ from pydantic_metamodel.api import (
     WithPredicate,
     WithPredicateNamespace,
     Year,
+    _check_fast_str_literal,
+    _fast_str_literal,
 )
 
 EX = Namespace("https://example.org/")
-ORCID = Namespace("https://orcid.org/")
-ROR = Namespace("https://ror.org/")
+ORCID = CachedNamespace("https://orcid.org/")
+ROR = CachedNamespace("https://ror.org/")
 SSSOM = Namespace("https://w3id.org/sssom/")
 SEMAPV = Namespace("https://w3id.org/semapv/vocab/")
-WIKIDATA = Namespace("https://www.wikidata.org/wiki/")
+WIKIDATA = CachedNamespace("https://www.wikidata.org/wiki/")
 HAS_WIKIDATA = EX["hasWikidata"]
 HAS_JUSTIFICATION = SSSOM["mapping_justification"]
 ISO639_3_NS = Namespace("http://lexvo.org/id/iso639-3/")
@@ -68,6 +77,61 @@ class Entity(RDFUntypedInstanceBaseModel):
         return URIRef(self.uri)
 
 
+class Step(RDFUntypedInstanceBaseModel):
+    """A step in a chain, which can be nested arbitrarily deep."""
+
+    index: int
+    previous: Annotated["Step | None", WithPredicate(EX["previous"])] = None
+
+    def get_node(self) -> URIRef:
+        """Get the URI for the step."""
+        return EX[f"step{self.index}"]
+
+
+class Friend(RDFUntypedInstanceBaseModel):
+    """An entity whose annotated field refers to a class that is defined afterwards."""
+
+    uri: str
+    knows: "Annotated[list[Acquaintance], WithPredicate(FOAF.knows)]" = Field(default_factory=list)
+
+    def get_node(self) -> Node:
+        """Get the node in a simple way."""
+        return URIRef(self.uri)
+
+
+class Team(RDFUntypedInstanceBaseModel):
+    """An entity whose annotated field refers to a class that is itself incomplete."""
+
+    uri: str
+    members: "Annotated[list[Member], WithPredicate(FOAF.member)]" = Field(default_factory=list)
+
+    def get_node(self) -> Node:
+        """Get the node in a simple way."""
+        return URIRef(self.uri)
+
+
+class Member(RDFUntypedInstanceBaseModel):
+    """An entity whose instances are only created while validating a :class:`Team`."""
+
+    uri: str
+    knows: "Annotated[list[Acquaintance], WithPredicate(FOAF.knows)]" = Field(default_factory=list)
+
+    def get_node(self) -> Node:
+        """Get the node in a simple way."""
+        return URIRef(self.uri)
+
+
+class Acquaintance(RDFUntypedInstanceBaseModel):
+    """An entity that is referred to by a forward reference."""
+
+    uri: str
+    name: Annotated[str, WithPredicate(RDFS.label)]
+
+    def get_node(self) -> Node:
+        """Get the node in a simple way."""
+        return URIRef(self.uri)
+
+
 class TestAPI(unittest.TestCase):
     """Tests for the API."""
 
@@ -76,20 +140,22 @@ class TestAPI(unittest.TestCase):
     ) -> None:
         """Check the triples are the same."""
         graph = model.get_graph()
-        self.assertEqual(
-            sorted(set(expected_triples)),
-            sorted(graph.triples((None, None, None))),
-        )
+        self.assertEqual(set(expected_triples), set(graph))
+        self.assertEqual(set(expected_triples), set(model.iter_triples()))
 
         expected_graph = rdflib.Graph()
-        for expected_triple in expected_triples:
-            expected_graph.add(expected_triple)
+        expected_graph += expected_triples
 
         self.assertEqual(
             expected_graph.serialize(format="ttl"),
             model.model_dump_turtle(),
         )
 
+        file = io.StringIO()
+        model.to_ntriples(file)
+        nt_graph = rdflib.Graph().parse(data=file.getvalue(), format="nt")
+        self.assertEqual(set(expected_graph), set(nt_graph))
+
     def test_simple_predicate(self) -> None:
         """Demonstrate the simple metadata model."""
 
@@ -108,6 +174,239 @@ class TestAPI(unittest.TestCase):
             person,
         )
 
+    def test_cached_predicate_fields(self) -> None:
+        """Test that predicate annotations are resolved once, when the class is defined."""
+        annotation = WithPredicate(RDFS.label)
+
+        class PersonWithName(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            name: Annotated[str, annotation]
+
+        self.assertEqual((), BasePerson._rdf_names)
+        self.assertEqual((), BasePerson._rdf_annotations)
+        self.assertEqual(("name",), PersonWithName._rdf_names)
+        self.assertEqual((annotation,), PersonWithName._rdf_annotations)
+        self.assertFalse(hasattr(annotation, "__dict__"))
+
+    def test_forward_reference(self) -> None:
+        """Test a field whose annotation is only resolved when the model is rebuilt."""
+        friend = Friend(uri=EX["a"], knows=[Acquaintance(uri=EX["b"], name="B")])
+        self.assertEqual(("knows",), Friend._rdf_names)
+        expected = {(EX["a"], FOAF.knows, EX["b"]), (EX["b"], RDFS.label, Literal("B"))}
+        self.assert_triples(expected, friend)
+
+        Friend.model_rebuild(force=True)
+        self.assertEqual(("knows",), Friend._rdf_names)
+        self.assert_triples(expected, friend)
+
+    def test_forward_reference_nested(self) -> None:
+        """Test a nested instance of a class that's still incomplete when serializing."""
+        team = Team.model_validate(
+            {
+                "uri": EX["team"],
+                "members": [{"uri": EX["a"], "knows": [{"uri": EX["b"], "name": "B"}]}],
+            }
+        )
+        self.assert_triples(
+            {
+                (EX["team"], FOAF.member, EX["a"]),
+                (EX["a"], FOAF.knows, EX["b"]),
+                (EX["b"], RDFS.label, Literal("B")),
+            },
+            team,
+        )
+        self.assertEqual(("knows",), Member._rdf_names)
+
+    def test_keyword_field_name(self) -> None:
+        """Test a field whose name is a keyword, which can only be made dynamically."""
+        fields: dict[str, Any] = {
+            "orcid": (str, ...),
+            "class": (Annotated[str, WithPredicate(SDO.category)], ...),
+        }
+        model = create_model("PersonWithKeyword", __base__=BasePerson, **fields)
+        person = model(orcid=CHARLIE_ORCID, **{"class": "researcher"})
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], SDO.category, Literal("researcher")),
+            },
+            person,
+        )
+
+    def test_multiple_predicate_annotations(self) -> None:
+        """Test that a field can't have multiple predicate annotations."""
+        with self.assertRaises(TypeError):
+
+            class PersonWithDuplicate(BasePerson):
+                """Represents a person."""
+
+                orcid: str
+                name: Annotated[str, WithPredicate(RDFS.label), WithPredicate(SKOS.prefLabel)]
+
+    def test_add_to_existing_graph(self) -> None:
+        """Test that triples are added in a batch to a graph that already has content."""
+
+        class PersonWithName(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            name: Annotated[str, WithPredicate(RDFS.label)]
+
+        existing_triple = (ORCID[CHARLIE_ORCID], FOAF.homepage, URIRef("https://cthoyt.com"))
+        graph = rdflib.Graph()
+        graph.add(existing_triple)
+
+        person = PersonWithName(orcid=CHARLIE_ORCID, name=CHARLIE_NAME)
+        self.assertEqual(ORCID[CHARLIE_ORCID], person.add_to_graph(graph))
+        self.assertEqual(
+            {
+                existing_triple,
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], RDFS.label, Literal(CHARLIE_NAME)),
+            },
+            set(graph),
+        )
+
+    def test_add_many_to_graph(self) -> None:
+        """Test adding several instances to a graph at once."""
+        e1 = Entity(uri="https://example.org/1", name="one")
+        e2 = Entity(uri="https://example.org/2")
+        graph = rdflib.Graph()
+        self.assertEqual(
+            [URIRef(e1.uri), URIRef(e2.uri)], Entity.add_many_to_graph([e1, e2], graph)
+        )
+        self.assertEqual({(URIRef(e1.uri), RDFS.label, Literal("one"))}, set(graph))
+
+    def test_to_ntriples_many(self) -> None:
+        """Test writing N-Triples for several instances, with and without worker processes."""
+        entities = [Entity(uri=EX[f"e{i}"], name=f"Entity {i}") for i in range(10)]
+        expected = {(EX[f"e{i}"], RDFS.label, Literal(f"Entity {i}")) for i in range(10)}
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                file = io.StringIO()
+                Entity.to_ntriples_many(entities, file, workers=workers, chunksize=3)
+                graph = rdflib.Graph().parse(data=file.getvalue(), format="nt")
+                self.assertEqual(expected, set(graph))
+
+    def test_node_per_serialization(self) -> None:
+        """Test that nodes reflect changes to instances, including nested ones."""
+        other_ror = "04xfq0f34"
+
+        class Organization(RDFUntypedInstanceBaseModel):
+            """Represents an organization."""
+
+            ror: str
+
+            def get_node(self) -> URIRef:
+                """Get the URI for the organization, based on its ROR."""
+                return ROR[self.ror]
+
+        class PersonWithNested(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            affiliations: Annotated[list[Organization], WithPredicate(FOAF.member)]
+
+        person = PersonWithNested(orcid=CHARLIE_ORCID, affiliations=[Organization(ror=NFDI_ROR)])
+        self.assertIn((ORCID[CHARLIE_ORCID], FOAF.member, ROR[NFDI_ROR]), person.get_graph())
+
+        person.affiliations[0].ror = other_ror
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], FOAF.member, ROR[other_ror]),
+            },
+            person,
+        )
+
+    def test_node_per_instance(self) -> None:
+        """Test that an instance referenced several times gets one node per serialization."""
+
+        class Anonymous(RDFUntypedInstanceBaseModel):
+            """Represents an anonymous organization."""
+
+            name: Annotated[str, WithPredicate(SDO.name)]
+
+            def get_node(self) -> BNode:
+                """Get a new blank node."""
+                return BNode()
+
+        class PersonWithAnonymous(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            affiliations: Annotated[list[Anonymous], WithPredicate(FOAF.member)]
+            employer: Annotated[Anonymous, WithPredicate(SDO.worksFor)]
+
+        organization = Anonymous(name="NFDI")
+        person = PersonWithAnonymous(
+            orcid=CHARLIE_ORCID, affiliations=[organization], employer=organization
+        )
+        graph = person.get_graph()
+        self.assertEqual(4, len(graph))
+        node = graph.value(ORCID[CHARLIE_ORCID], SDO.worksFor)
+        self.assertIsInstance(node, BNode)
+        self.assertIn((ORCID[CHARLIE_ORCID], FOAF.member, node), graph)
+        self.assertIn((node, SDO.name, Literal("NFDI")), graph)
+
+    def test_annotation_add_to_graph_only(self) -> None:
+        """Test a predicate annotation that only implements add_to_graph."""
+
+        class WithInversePredicate(PredicateAnnotation):
+            """Serializes a field with the instance as the object."""
+
+            def __init__(self, predicate: URIRef) -> None:
+                """Initialize the annotation with a predicate."""
+                self.predicate = predicate
+
+            def add_to_graph(self, graph: rdflib.Graph, node: Node, value: Addable) -> None:
+                """Add to the graph."""
+                graph.add((URIRef(str(value)), self.predicate, node))
+
+        class PersonWithEmployer(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            employer: Annotated[str, WithInversePredicate(SDO.employee)]
+
+        person = PersonWithEmployer(orcid=CHARLIE_ORCID, employer=ROR[NFDI_ROR])
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ROR[NFDI_ROR], SDO.employee, ORCID[CHARLIE_ORCID]),
+            },
+            person,
+        )
+
+    def test_annotation_add_to_graph_override(self) -> None:
+        """Test a predicate annotation subclass that overrides add_to_graph."""
+
+        class WithCommentedPredicate(WithPredicate):
+            """Serializes a field with a predicate, and comments on the instance."""
+
+            def add_to_graph(self, graph: rdflib.Graph, node: Node, value: Addable) -> None:
+                """Add to the graph."""
+                super().add_to_graph(graph, node, value)
+                graph.add((node, RDFS.comment, Literal(f"has a {self.predicate}")))
+
+        class PersonWithComment(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            name: Annotated[str, WithCommentedPredicate(SDO.name)]
+
+        person = PersonWithComment(orcid=CHARLIE_ORCID, name="Charlie")
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], SDO.name, Literal("Charlie")),
+                (ORCID[CHARLIE_ORCID], RDFS.comment, Literal(f"has a {SDO.name}")),
+            },
+            person,
+        )
+
     def test_simple_predicate_datetime(self) -> None:
         """Demonstrate the simple metadata model."""
 
@@ -133,6 +432,79 @@ class TestAPI(unittest.TestCase):
             person,
         )
 
+    def test_simple_predicate_cached_literals(self) -> None:
+        """Test that cached literals don't mix up equal values of different types."""
+
+        class PersonWithFlags(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            count: Annotated[int, WithPredicate(EX["count"])]
+            flag: Annotated[bool, WithPredicate(EX["flag"])]
+
+        for _ in range(2):
+            self.assert_triples(
+                {
+                    (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                    (ORCID[CHARLIE_ORCID], EX["count"], Literal(1)),
+                    (ORCID[CHARLIE_ORCID], EX["flag"], Literal(True)),
+                },
+                PersonWithFlags(orcid=CHARLIE_ORCID, count=1, flag=True),
+            )
+
+    def test_fast_str_literal(self) -> None:
+        """Test that plain literals made from strings match ones from the constructor."""
+        self.assertTrue(_check_fast_str_literal())
+        for value in ["", "test", "Charles Tapley Hoyt", "line\nbreak", '"quoted"', "1"]:
+            with self.subTest(value=value):
+                fast, reference = _fast_str_literal(value), Literal(value)
+                self.assertEqual(reference, fast)
+                self.assertEqual(hash(reference), hash(fast))
+                self.assertEqual(reference.n3(), fast.n3())
+                for slot in Literal.__slots__:
+                    self.assertEqual(getattr(reference, slot), getattr(fast, slot))
+
+    def test_ntriples_escape(self) -> None:
+        """Test writing N-Triples for literals that need escaping."""
+        name = 'Charles "Charlie"\nTapley\\Hoyt\r'
+        entity = Entity(uri=ORCID[CHARLIE_ORCID], name=name)
+        file = io.StringIO()
+        entity.to_ntriples(file)
+        self.assertEqual(
+            f"<{ORCID[CHARLIE_ORCID]}> <{RDFS.label}> "
+            '"Charles \\"Charlie\\"\\nTapley\\\\Hoyt\\r" .\n',
+            file.getvalue(),
+        )
+        self.assert_triples([(ORCID[CHARLIE_ORCID], RDFS.label, Literal(name))], entity)
+
+    def test_cached_namespace(self) -> None:
+        """Test that a cached namespace reuses the URIs it constructs."""
+        self.assertIsInstance(ORCID[CHARLIE_ORCID], URIRef)
+        self.assertEqual(URIRef(f"https://orcid.org/{CHARLIE_ORCID}"), ORCID[CHARLIE_ORCID])
+        self.assertIs(ORCID[CHARLIE_ORCID], ORCID[CHARLIE_ORCID])
+        self.assertIs(ORCID.term("test"), ORCID.test)
+
+        # annotations share the same cache
+        triples: list[tuple[Node, Node, Node]] = []
+        annotation = WithPredicateNamespace(DCTERMS.contributor, ORCID)
+        annotation.collect(triples, Pending(), EX["x"], CHARLIE_ORCID)
+        self.assertIs(ORCID[CHARLIE_ORCID], triples[0][2])
+        self.assertNotEqual(ORCID[CHARLIE_ORCID], ROR[CHARLIE_ORCID])
+
+    def test_ntriples_invalid_uri(self) -> None:
+        """Test that URIs that would break N-Triples aren't written."""
+
+        class PersonWithWikidata(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            wikidata: Annotated[str, WithPredicateNamespace(HAS_WIKIDATA, WIKIDATA)]
+
+        for value in ["x> <y", "x\ty\nz"]:
+            person = PersonWithWikidata(orcid=CHARLIE_ORCID, wikidata=value)
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                person.to_ntriples(io.StringIO())
+
     def test_simple_predicate_year(self) -> None:
         """Demonstrate the simple metadata model."""
 
@@ -191,6 +563,25 @@ class TestAPI(unittest.TestCase):
             person,
         )
 
+    def test_simple_predicate_list(self) -> None:
+        """Test a list of primitive values."""
+
+        class PersonWithSynonyms(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            synonyms: Annotated[list[str], WithPredicate(SKOS.altLabel)]
+
+        person = PersonWithSynonyms(orcid=CHARLIE_ORCID, synonyms=["Charlie", "C. T. Hoyt"])
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], SKOS.altLabel, Literal("Charlie")),
+                (ORCID[CHARLIE_ORCID], SKOS.altLabel, Literal("C. T. Hoyt")),
+            },
+            person,
+        )
+
     def test_simple_predicate_namespace(self) -> None:
         """Demonstrate the simple metadata model."""
 
@@ -209,6 +600,35 @@ class TestAPI(unittest.TestCase):
             person,
         )
 
+        # check that URIs constructed in the namespace are reused
+        self.assertIs(
+            person.get_graph().value(ORCID[CHARLIE_ORCID], HAS_WIKIDATA),
+            person.get_graph().value(ORCID[CHARLIE_ORCID], HAS_WIKIDATA),
+        )
+
+    def test_simple_predicate_namespace_prefix(self) -> None:
+        """Test binding a prefix for the namespace in a ``WithPredicateNamespace``."""
+
+        class PersonWithPrefix(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            wikidata: Annotated[str, WithPredicateNamespace(HAS_WIKIDATA, WIKIDATA, "wikidata")]
+
+        person = PersonWithPrefix(orcid=CHARLIE_ORCID, wikidata=CHARLIE_WD)
+        self.assertEqual((("wikidata", WIKIDATA),), PersonWithPrefix._rdf_namespaces)
+
+        graph = person.get_graph()
+        self.assertEqual(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], HAS_WIKIDATA, WIKIDATA[CHARLIE_WD]),
+            },
+            set(graph),
+        )
+        self.assertIn(("wikidata", URIRef(WIKIDATA)), set(graph.namespaces()))
+        self.assertIn(f"wikidata:{CHARLIE_WD}", person.model_dump_turtle())
+
     def test_unhandled_type(self) -> None:
         """Test raising when an unhandled object type is used."""
 
@@ -238,6 +658,27 @@ class TestAPI(unittest.TestCase):
         with self.assertRaises(TypeError):
             PersonWithInvalidDefinition(orcid=CHARLIE_ORCID, wikidata=0.5).get_graph()
 
+    def test_simple_predicate_namespace_closed(self) -> None:
+        """Test that ``WithPredicateNamespace`` respects the terms of a closed namespace."""
+        closed = ClosedNamespace("https://example.org/closed/", ["ok"])
+
+        class PersonWithClosed(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            see_also: Annotated[list[str], WithPredicateNamespace(RDFS.seeAlso, closed)]
+
+        person = PersonWithClosed(orcid=CHARLIE_ORCID, see_also=["ok"])
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], RDFS.seeAlso, closed.ok),
+            },
+            person,
+        )
+        with self.assertRaises(KeyError):
+            PersonWithClosed(orcid=CHARLIE_ORCID, see_also=["bad"]).get_graph()
+
     def test_nested(self) -> None:
         """Test a nested model."""
 
@@ -275,6 +716,250 @@ class TestAPI(unittest.TestCase):
             person,
         )
 
+    def test_nested_tuple(self) -> None:
+        """Test tuples of nested models and of strings in a namespace."""
+
+        class Organization(RDFInstanceBaseModel):
+            """Represents an organization."""
+
+            rdf_type: ClassVar[URIRef] = SDO.Organization
+
+            ror: str
+
+            def get_node(self) -> URIRef:
+                """Get the URI for the organization, based on its ROR."""
+                return ROR[self.ror]
+
+        class PersonWithTuples(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            affiliations: Annotated[tuple[Organization, ...], WithPredicate(FOAF.member)] = ()
+            wikidata: Annotated[
+                tuple[str, ...], WithPredicateNamespace(HAS_WIKIDATA, WIKIDATA)
+            ] = ()
+
+        person = PersonWithTuples(
+            orcid=CHARLIE_ORCID,
+            affiliations=[Organization(ror=NFDI_ROR)],
+            wikidata=[CHARLIE_WD],
+        )
+        self.assertIsInstance(person.affiliations, tuple)
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ROR[NFDI_ROR], RDF.type, SDO.Organization),
+                (ORCID[CHARLIE_ORCID], FOAF.member, ROR[NFDI_ROR]),
+                (ORCID[CHARLIE_ORCID], HAS_WIKIDATA, WIKIDATA[CHARLIE_WD]),
+            },
+            person,
+        )
+        self.assert_triples(
+            {(ORCID[CHARLIE_ORCID], RDF.type, SDO.Person)},
+            PersonWithTuples(orcid=CHARLIE_ORCID),
+        )
+
+    def test_nested_add_to_graph_override(self) -> None:
+        """Test that an override of add_to_graph is used, including for nested instances."""
+
+        class Organization(RDFInstanceBaseModel):
+            """Represents an organization, with an extra triple for its ROR."""
+
+            rdf_type: ClassVar[URIRef] = SDO.Organization
+
+            ror: str
+            name: Annotated[str, WithPredicate(RDFS.label)]
+
+            def get_node(self) -> URIRef:
+                """Get the URI for the organization, based on its ROR."""
+                return ROR[self.ror]
+
+            def add_to_graph(self, graph: rdflib.Graph) -> Node:
+                """Add to the graph, including the ROR as a notation."""
+                node = super().add_to_graph(graph)
+                graph.add((node, SKOS.notation, Literal(self.ror)))
+                return node
+
+        class PersonWithNested(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            affiliations: Annotated[list[Organization], WithPredicate(FOAF.member)]
+
+        organization = Organization(ror=NFDI_ROR, name=NFDI_NAME)
+        organization_triples = {
+            (ROR[NFDI_ROR], RDF.type, SDO.Organization),
+            (ROR[NFDI_ROR], RDFS.label, Literal(NFDI_NAME)),
+            (ROR[NFDI_ROR], SKOS.notation, Literal(NFDI_ROR)),
+        }
+        self.assert_triples(organization_triples, organization)
+        self.assert_triples(
+            {
+                *organization_triples,
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], FOAF.member, ROR[NFDI_ROR]),
+            },
+            PersonWithNested(orcid=CHARLIE_ORCID, affiliations=[organization]),
+        )
+
+    def test_nested_triple_add_to_graph_override(self) -> None:
+        """Test that a nested triple with an override of add_to_graph uses its node."""
+
+        class CommentedMapping(RDFTripleBaseModel):
+            """Represents a mapping, with a comment on its reification."""
+
+            s: Annotated[RDFResource, IsSubject()]
+            p: Annotated[RDFResource, IsPredicate()]
+            o: Annotated[RDFResource, IsObject()]
+
+            def add_to_graph(self, graph: rdflib.Graph) -> Node:
+                """Add to the graph, including a comment."""
+                node = super().add_to_graph(graph)
+                graph.add((node, RDFS.comment, Literal("curated")))
+                return node
+
+        class PersonWithMapping(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            mapping: Annotated[CommentedMapping, WithPredicate(DCTERMS.creator)]
+
+        s_uri = URIRef("https://purl.obolibrary.org/obo/CHEBI_10001")
+        o_uri = URIRef("http://id.nlm.nih.gov/mesh/C067604")
+        person = PersonWithMapping(
+            orcid=CHARLIE_ORCID,
+            mapping=CommentedMapping(s=s_uri, p=SKOS.exactMatch, o=o_uri),
+        )
+        graph = person.get_graph()
+        node = graph.value(ORCID[CHARLIE_ORCID], DCTERMS.creator)
+        self.assertIsInstance(node, BNode)
+        self.assertIn((node, RDF.type, RDF.Statement), graph)
+        self.assertIn((node, RDF.subject, s_uri), graph)
+        self.assertIn((node, RDFS.comment, Literal("curated")), graph)
+        self.assertEqual(8, len(graph))
+
+    def test_nested_add_to_graph_only(self) -> None:
+        """Test a model that only implements add_to_graph and get_node."""
+
+        class Label(RDFBaseModel):
+            """Represents a labeled entity."""
+
+            uri: str
+            label: str
+
+            def get_node(self) -> URIRef:
+                """Get the URI for the entity."""
+                return URIRef(self.uri)
+
+            def add_to_graph(self, graph: rdflib.Graph) -> Node:
+                """Add the label to the graph."""
+                node = self.get_node()
+                graph.add((node, RDFS.label, Literal(self.label)))
+                return node
+
+        class PersonWithSubject(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            subject: Annotated[Label, WithPredicate(DCTERMS.subject)]
+
+        person = PersonWithSubject(orcid=CHARLIE_ORCID, subject=Label(uri=EX["x"], label="X"))
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], DCTERMS.subject, EX["x"]),
+                (EX["x"], RDFS.label, Literal("X")),
+            },
+            person,
+        )
+
+    def test_nested_untyped(self) -> None:
+        """Test a nested model that doesn't have an RDF type."""
+        uri = URIRef("https://example.org/1")
+
+        class PersonWithNestedEntity(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            related: Annotated[Entity, WithPredicate(RDFS.seeAlso)]
+
+        person = PersonWithNestedEntity(
+            orcid=CHARLIE_ORCID, related=Entity(uri=str(uri), name="Example")
+        )
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], RDFS.seeAlso, uri),
+                (uri, RDFS.label, Literal("Example")),
+            },
+            person,
+        )
+
+    def test_nested_deep(self) -> None:
+        """Test that deeply nested models don't hit the recursion limit."""
+        step = Step(index=0)
+        for index in range(1, sys.getrecursionlimit() + 10):
+            step = Step(index=index, previous=step)
+
+        graph = step.get_graph()
+        self.assertEqual(sys.getrecursionlimit() + 9, len(graph))
+        self.assertIn((EX["step1"], EX["previous"], EX["step0"]), graph)
+
+    def test_nested_shared(self) -> None:
+        """Test that a nested instance shared by several instances is only collected once."""
+
+        class Organization(RDFInstanceBaseModel):
+            """Represents an organization."""
+
+            rdf_type: ClassVar[URIRef] = SDO.Organization
+
+            ror: str
+            name: Annotated[str, WithPredicate(RDFS.label)]
+
+            def get_node(self) -> URIRef:
+                """Get the URI for the organization, based on its ROR."""
+                return ROR[self.ror]
+
+        class PersonWithNested(BasePerson):
+            """Represents a person."""
+
+            orcid: str
+            affiliations: Annotated[list[Organization], WithPredicate(FOAF.member)]
+
+        other_orcid = "0000-0000-0000-0000"
+        organization = Organization(ror=NFDI_ROR, name=NFDI_NAME)
+        p1 = PersonWithNested(orcid=CHARLIE_ORCID, affiliations=[organization])
+        p2 = PersonWithNested(orcid=other_orcid, affiliations=[organization])
+
+        triples: list[tuple[Node, Node, Node]] = []
+        seen: set[Node] = set()
+        p1.collect(triples, seen)
+        p2.collect(triples, seen)
+        expected = {
+            (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+            (ORCID[other_orcid], RDF.type, SDO.Person),
+            (ORCID[CHARLIE_ORCID], FOAF.member, ROR[NFDI_ROR]),
+            (ORCID[other_orcid], FOAF.member, ROR[NFDI_ROR]),
+            (ROR[NFDI_ROR], RDF.type, SDO.Organization),
+            (ROR[NFDI_ROR], RDFS.label, Literal(NFDI_NAME)),
+        }
+        self.assertEqual(len(expected), len(triples))
+        self.assertEqual(expected, set(triples))
+        self.assertEqual(expected, set(PersonWithNested.get_graph_many([p1, p2])))
+
+    def test_nested_cycle(self) -> None:
+        """Test that instances referencing each other don't cause an infinite loop."""
+        s0 = Step(index=0)
+        s1 = Step(index=1, previous=s0)
+        s0.previous = s1
+        self.assertEqual(
+            {
+                (EX["step1"], EX["previous"], EX["step0"]),
+                (EX["step0"], EX["previous"], EX["step1"]),
+            },
+            set(s0.iter_triples()),
+        )
+
     def test_triple_default_node(self) -> None:
         """Test a triple model."""
 
@@ -292,6 +977,17 @@ class TestAPI(unittest.TestCase):
         )
         self.assertIsInstance(person.get_node(), BNode)
 
+        # the same blank node is used throughout a serialization,
+        # but each serialization gets a new one
+        nodes = []
+        for _ in range(2):
+            graph = person.get_graph()
+            node = graph.value(predicate=RDF.type, object=RDF.Statement)
+            self.assertIsInstance(node, BNode)
+            self.assertEqual(4, len(set(graph.triples((node, None, None)))))
+            nodes.append(node)
+        self.assertNotEqual(*nodes)
+
     def test_triple_wrapped(self) -> None:
         """Test a triple model."""
         mapping_uri = URIRef("https://example.org/testuri")
@@ -324,7 +1020,7 @@ class TestAPI(unittest.TestCase):
             class Nope(TripleAnnotation):
                 """A dummy triple annotation."""
 
-            person._get(Nope, rdflib.Graph())
+            person._get(Nope, Pending())
 
         self.assert_triples(
             {
@@ -492,6 +1188,23 @@ class TestAPI(unittest.TestCase):
             MultilingualPerson(orcid=CHARLIE_ORCID, speaks=["eng", "deu"]),
         )
 
+    def test_string_subclass_literal(self) -> None:
+        """Test that string subclasses fall back to being serialized as literals."""
+
+        class PersonWithLanguage(BasePerson):
+            """A person with a language."""
+
+            orcid: str
+            language: Annotated[ISO639_3, WithPredicate(DCTERMS.language)]
+
+        self.assert_triples(
+            {
+                (ORCID[CHARLIE_ORCID], RDF.type, SDO.Person),
+                (ORCID[CHARLIE_ORCID], DCTERMS.language, Literal("eng")),
+            },
+            PersonWithLanguage(orcid=CHARLIE_ORCID, language="eng"),
+        )
+
     def test_predicate_object_raises(self) -> None:
         """Test predicate-object."""
 